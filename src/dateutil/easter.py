@@ -6,12 +6,23 @@ Western, Orthodox or Julian algorithms.
 
 import datetime
 
-__all__ = ["easter", "EASTER_JULIAN", "EASTER_ORTHODOX", "EASTER_WESTERN"]
+import six
+
+__all__ = ["easter", "easter_array", "easter_offset", "easter_ordinal",
+           "EASTER_JULIAN", "EASTER_ORTHODOX", "EASTER_WESTERN"]
 
 EASTER_JULIAN = 1
 EASTER_ORTHODOX = 2
 EASTER_WESTERN = 3
 
+# Results are immutable ``datetime.date`` objects and ``easter()`` is a pure
+# function of ``(year, method)``, so they can be shared between callers. The
+# cache is naturally bounded: only years representable by ``datetime.date``
+# (1 to 9999) ever produce a result to store.
+_easter_cache = {}
+
+_NON_NUMERIC_TYPES = six.string_types + (bytes,)
+
 
 def easter(year, method=EASTER_WESTERN):
     """
@@ -47,43 +58,247 @@ def easter(year, method=EASTER_WESTERN):
 
     `The Calendar FAQ: Easter <https://www.tondering.dk/claus/cal/easter.php>`_
 
+    Results are memoized on ``(year, method)``, so repeated calls for the same
+    year return the same :class:`datetime.date` instance. To compute Easter for
+    many years at once, see :func:`easter_array`.
+
     """
+    # Look up the raw arguments first: integral floats such as 2021.0 hash
+    # and compare equal to their int keys, while strings and fractional
+    # values can never match one, so only a miss needs to be validated.
+    try:
+        return _easter_cache[(year, method)]
+    except (KeyError, TypeError):
+        pass
+
+    year, method = _as_int(year), _as_int(method)
+    m, d = _easter_md(year, method)
+    return _easter_cache.setdefault((year, method), datetime.date(year, m, d))
 
+
+def _easter_md(year, method):
+    # Validates integer ``year`` and ``method`` and returns Easter's month and
+    # day, shared by easter() and easter_ordinal() so that the two agree.
     if not (1 <= method <= 3):
         raise ValueError("invalid method")
 
-    # g - Golden year - 1
-    # c - Century
-    # h - (23 - Epact) mod 30
-    # i - Number of days from March 21 to Paschal Full Moon
-    # j - Weekday for PFM (0=Sunday, etc)
-    # p - Number of days from March 21 to Sunday on or before PFM
-    #     (-6 to 28 methods 1 & 3, to 56 for method 2)
-    # e - Extra days to add for method 2 (converting Julian
-    #     date to Gregorian date)
-
-    y = year
+    if not (datetime.MINYEAR <= year <= datetime.MAXYEAR):
+        raise ValueError("year %d is out of range" % year)
+
+    p = _EASTER_METHODS[method - 1](year)
+    d = 1 + (p + 27 + (p + 6)//40) % 31
+    m = 3 + (p + 26)//30
+
+    # Far in the future, method 2 can produce dates such as 31 June
+    if d > _DAYS_IN_MONTH_FROM_MARCH[m - 3]:
+        raise ValueError("day is out of range for month")
+
+    return m, d
+
+
+def _as_int(value):
+    # Accepts ints and integral numbers of other types (e.g. 2021.0), but not
+    # strings or numbers with a fractional part.
+    if isinstance(value, _NON_NUMERIC_TYPES):
+        raise TypeError("expected a number, got %r" % (value,))
+
+    int_value = int(value)
+    if int_value != value:
+        raise ValueError("expected an integer, got %r" % (value,))
+
+    return int_value
+
+
+def easter_offset(year, days, method=EASTER_WESTERN):
+    """
+    Returns the date ``days`` days after Easter (or before, if ``days`` is
+    negative) in the given year, e.g. ``easter_offset(year, -2)`` for Good
+    Friday or ``easter_offset(year, 39)`` for Ascension Day.
+
+    This is equivalent to ``easter(year, method) + timedelta(days=days)``.
+    Plain day offsets like these do not need the month and weekday handling
+    of :class:`dateutil.relativedelta.relativedelta`, and a
+    :class:`datetime.timedelta` is considerably cheaper to apply when computing
+    many Easter-relative holidays.
+
+    .. versionadded:: 2.10.0
+    """
+    return easter(year, method) + datetime.timedelta(days=days)
+
+
+def easter_ordinal(year, method=EASTER_WESTERN):
+    """
+    Returns the proleptic Gregorian ordinal of Easter in the given year, as
+    ``easter(year, method).toordinal()`` would, but without constructing a
+    :class:`datetime.date`. Arithmetic on many Easter-relative dates can be
+    done on the ordinal, converting back with
+    :meth:`datetime.date.fromordinal` only when needed.
+
+    As with :func:`easter`, results are only meaningful in the years for which
+    the chosen method is valid.
+
+    .. versionadded:: 2.10.0
+    """
+    year = _as_int(year)
+    m, d = _easter_md(year, _as_int(method))
+
+    # Ordinal of the last day of February, see _ymd2ord in CPython's datetime
+    # module
+    y1 = year - 1
+    feb_end = (y1*365 + y1//4 - y1//100 + y1//400 + 59 +
+               (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)))
+    return feb_end + _DAYS_BEFORE_MONTH_FROM_MARCH[m - 3] + d
+
+
+# Lengths of the months from March on, and the number of days from 1 March to
+# the first of each of them
+_DAYS_IN_MONTH_FROM_MARCH = (31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_BEFORE_MONTH_FROM_MARCH = (0, 31, 61, 92, 122, 153, 184, 214, 245, 275)
+
+
+# g - Golden year - 1
+# c - Century
+# h - (23 - Epact) mod 30
+# i - Number of days from March 21 to Paschal Full Moon
+# j - Weekday for PFM (0=Sunday, etc)
+# p - Number of days from March 21 to Sunday on or before PFM
+#     (-6 to 28 methods 1 & 3, to 56 for method 2)
+# e - Extra days to add for method 2 (converting Julian
+#     date to Gregorian date)
+#
+# p can be from -6 to 56 corresponding to dates 22 March to 23 May
+# (later dates apply to method 2, although 23 May never actually occurs)
+
+def _easter_julian(y):
+    g = y % 19
+    i = (19*g + 15) % 30
+    j = (y + y//4 + i) % 7
+
+    return i - j
+
+
+def _easter_orthodox(y):
+    g = y % 19
+    i = (19*g + 15) % 30
+    j = (y + y//4 + i) % 7
+
+    # Extra dates to convert Julian to Gregorian date
+    if y > 1600:
+        c16 = y//100 - 16
+        p = i - j + 10 + c16 - c16//4
+    else:
+        p = i - j + 10
+
+    return p
+
+
+# Correction from h to i in the Western method, which only depends on
+# h (0-29) and g (0-18).
+_WESTERN_I_CORRECTION = tuple(
+    tuple((h//28)*(1 - (h//28)*(29//(h + 1))*((21 - g)//11))
+          for g in range(19))
+    for h in range(30)
+)
+
+
+# The century-dependent terms of h and j, for every century that
+# datetime.date can represent.
+_WESTERN_H_OFFSET = tuple((c - c//4 - (8*c + 13)//25) % 30
+                          for c in range(datetime.MAXYEAR//100 + 1))
+_WESTERN_J_OFFSET = tuple((2 - c + c//4) % 7
+                          for c in range(datetime.MAXYEAR//100 + 1))
+
+
+def _easter_western(y):
+    g = y % 19
+    c = y//100
+    h = (_WESTERN_H_OFFSET[c] + 19*g + 15) % 30
+    i = h - _WESTERN_I_CORRECTION[h][g]
+    j = (y + y//4 + i + _WESTERN_J_OFFSET[c]) % 7
+
+    return i - j
+
+
+# Indexed by ``method - 1``; each returns ``p`` for the given year.
+_EASTER_METHODS = (_easter_julian, _easter_orthodox, _easter_western)
+
+
+def easter_array(years, method=EASTER_WESTERN):
+    """
+    Vectorized version of :func:`easter`, computing Easter for many years at
+    once using NumPy.
+
+    :param years:
+        An array-like or iterable of integer years, e.g. a :class:`list`, a
+        :class:`range` or a :class:`numpy.ndarray`.
+
+    :param method:
+        One of ``EASTER_JULIAN``, ``EASTER_ORTHODOX`` or ``EASTER_WESTERN``,
+        applied to all years.
+
+    :return:
+        Returns a :class:`numpy.ndarray` of dtype ``datetime64[D]`` with the
+        same shape as ``years``.
+
+    .. note::
+        This function requires `NumPy <https://numpy.org>`_, which is not a
+        dependency of ``dateutil`` and must be installed separately.
+
+    .. versionadded:: 2.10.0
+    """
+    import numpy as np
+
+    method = _as_int(method)
+    if not (1 <= method <= 3):
+        raise ValueError("invalid method")
+
+    if not (hasattr(years, '__len__') or hasattr(years, '__array__')):
+        years = list(years)
+    y = np.asarray(years)
+
+    # As in easter(), reject strings and numbers with a fractional part
+    # rather than letting the int64 cast truncate them
+    if y.dtype.kind in 'USV':
+        raise TypeError("expected a number, got %r" %
+                        (y.flat[0].item() if y.size else y.dtype,))
+
+    if y.dtype.kind not in 'iu':
+        with np.errstate(invalid='ignore'):
+            y_int = y.astype(np.int64)
+        fractional = y_int != y
+        if fractional.any():
+            raise ValueError("expected an integer, got %r" %
+                             (y[fractional].tolist()[0],))
+        y = y_int
+    else:
+        y = y.astype(np.int64, copy=False)
+
+    bad = (y < datetime.MINYEAR) | (y > datetime.MAXYEAR)
+    if bad.any():
+        raise ValueError("year %d is out of range" % y[bad].flat[0])
+
     g = y % 19
-    e = 0
     if method < 3:
-        # Old method
         i = (19*g + 15) % 30
         j = (y + y//4 + i) % 7
+        p = i - j
         if method == 2:
-            # Extra dates to convert Julian to Gregorian date
-            e = 10
-            if y > 1600:
-                e = e + y//100 - 16 - (y//100 - 16)//4
+            c = y//100
+            p = p + 10 + np.where(y > 1600, c - 16 - (c - 16)//4, 0)
     else:
-        # New method
         c = y//100
         h = (c - c//4 - (8*c + 13)//25 + 19*g + 15) % 30
         i = h - (h//28)*(1 - (h//28)*(29//(h + 1))*((21 - g)//11))
         j = (y + y//4 + i + 2 - c + c//4) % 7
+        p = i - j
 
-    # p can be from -6 to 56 corresponding to dates 22 March to 23 May
-    # (later dates apply to method 2, although 23 May never actually occurs)
-    p = i - j + e
     d = 1 + (p + 27 + (p + 6)//40) % 31
     m = 3 + (p + 26)//30
-    return datetime.date(int(y), int(m), int(d))
+
+    # As in _easter_md(), method 2 can produce dates such as 31 June
+    if (d > np.asarray(_DAYS_IN_MONTH_FROM_MARCH)[m - 3]).any():
+        raise ValueError("day is out of range for month")
+
+    return ((y - 1970).astype('datetime64[Y]') +
+            (m - 1).astype('timedelta64[M]') +
+            (d - 1).astype('timedelta64[D]'))
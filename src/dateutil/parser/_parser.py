@@ -36,11 +36,12 @@ import string
 import time
 import warnings
 
-from calendar import monthrange
-from io import StringIO
+from calendar import isleap, monthrange
+from collections import OrderedDict
 
 import six
 from six import integer_types, text_type
+from six.moves import _thread
 
 from decimal import Decimal
 
@@ -49,28 +50,63 @@ from warnings import warn
 from .. import relativedelta
 from .. import tz
 
-__all__ = ["parse", "parserinfo", "ParserError"]
+__all__ = ["parse", "parse_cached", "parserinfo", "ParserError"]
+
+
+# The _timelex.get_token() state machine expressed as a regular expression, for
+# ASCII input where str.isalpha() and str.isdigit() agree with [A-Za-z] and
+# [0-9]. Dot-separated runs of letters and digits are matched as one token and
+# broken up afterwards, exactly as get_token() does.
+_TIMELEX_ASCII_RE = re.compile(r"""
+    (
+        [0-9]{2,},[0-9]*                    # 12,5 (comma as decimal point)
+        (?:\.+(?:[A-Za-z]+|[0-9]+))*\.*
+    |
+        (?:[A-Za-z]+|[0-9]+)                # word or number, then
+        (?:\.(?:[A-Za-z]+|[0-9]+)?          # optionally dot-separated parts
+         (?:\.+(?:[A-Za-z]+|[0-9]+))*\.*)?
+    )
+    | (\s)
+    | (.)
+""", re.VERBOSE | re.DOTALL)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+# Fractional seconds are sometimes split by a comma
+_SPLIT_DECIMAL_RE = re.compile("([.,])")
+
+# Splits a TZ variable string into its tokens, see _tzparser.parse()
+_TZPARSER_SPLIT_RE = re.compile(r'([,:.]|[a-zA-Z]+|[0-9]+)')
+
+# Characters that start the offset/rule part of a TZ string
+_TZPARSER_NUMERIC = frozenset("0123456789:,-+")
 
 
 # TODO: pandas.core.tools.datetimes imports this explicitly.  Might be worth
 # making public and/or figuring out if there is something we can
 # take off their plate.
 class _timelex(object):
-    # Fractional seconds are sometimes split by a comma
-    _split_decimal = re.compile("([.,])")
+    # Kept for backwards compatibility, _SPLIT_DECIMAL_RE is used directly
+    _split_decimal = _SPLIT_DECIMAL_RE
 
     def __init__(self, instream):
         if isinstance(instream, (bytes, bytearray)):
             instream = instream.decode()
 
         if isinstance(instream, text_type):
-            instream = StringIO(instream)
+            # Strings are scanned in place with a cursor, so pushing a
+            # character back is just a matter of moving the cursor back.
+            self._string = instream.replace('\x00', '')
+            self._pos = 0
+            instream = None
         elif getattr(instream, 'read', None) is None:
             raise TypeError('Parser must be a string or character stream, not '
                             '{itype}'.format(itype=instream.__class__.__name__))
+        else:
+            self._string = None
 
         self.instream = instream
-        self.charstack = []
+        # At most one character is ever pushed back, and only for streams
+        self._pushback = None
         self.tokenstack = []
         self.eof = False
 
@@ -94,14 +130,23 @@ class _timelex(object):
         seenletters = False
         token = None
         state = None
+        pushback = False
+
+        string = self._string
+        if string is not None:
+            pos = self._pos
 
         while not self.eof:
             # We only realize that we've reached the end of a token when we
             # find a character that's not part of the current token - since
-            # that character may be part of the next token, it's stored in the
-            # charstack.
-            if self.charstack:
-                nextchar = self.charstack.pop(0)
+            # that character may be part of the next token, it's pushed back
+            # to be read again.
+            if string is not None:
+                nextchar = string[pos:pos + 1]
+                pos += 1
+            elif self._pushback is not None:
+                nextchar = self._pushback
+                self._pushback = None
             else:
                 nextchar = self.instream.read(1)
                 while nextchar == '\x00':
@@ -114,11 +159,11 @@ class _timelex(object):
                 # First character of the token - determines if we're starting
                 # to parse a word, a number or something else.
                 token = nextchar
-                if self.isword(nextchar):
+                if nextchar.isalpha():
                     state = 'a'
-                elif self.isnum(nextchar):
+                elif nextchar.isdigit():
                     state = '0'
-                elif self.isspace(nextchar):
+                elif nextchar.isspace():
                     token = ' '
                     break  # emit token
                 else:
@@ -127,52 +172,57 @@ class _timelex(object):
                 # If we've already started reading a word, we keep reading
                 # letters until we find something that's not part of a word.
                 seenletters = True
-                if self.isword(nextchar):
+                if nextchar.isalpha():
                     token += nextchar
                 elif nextchar == '.':
                     token += nextchar
                     state = 'a.'
                 else:
-                    self.charstack.append(nextchar)
+                    pushback = True
                     break  # emit token
             elif state == '0':
                 # If we've already started reading a number, we keep reading
                 # numbers until we find something that doesn't fit.
-                if self.isnum(nextchar):
+                if nextchar.isdigit():
                     token += nextchar
                 elif nextchar == '.' or (nextchar == ',' and len(token) >= 2):
                     token += nextchar
                     state = '0.'
                 else:
-                    self.charstack.append(nextchar)
+                    pushback = True
                     break  # emit token
             elif state == 'a.':
                 # If we've seen some letters and a dot separator, continue
                 # parsing, and the tokens will be broken up later.
                 seenletters = True
-                if nextchar == '.' or self.isword(nextchar):
+                if nextchar == '.' or nextchar.isalpha():
                     token += nextchar
-                elif self.isnum(nextchar) and token[-1] == '.':
+                elif nextchar.isdigit() and token[-1] == '.':
                     token += nextchar
                     state = '0.'
                 else:
-                    self.charstack.append(nextchar)
+                    pushback = True
                     break  # emit token
             elif state == '0.':
                 # If we've seen at least one dot separator, keep going, we'll
                 # break up the tokens later.
-                if nextchar == '.' or self.isnum(nextchar):
+                if nextchar == '.' or nextchar.isdigit():
                     token += nextchar
-                elif self.isword(nextchar) and token[-1] == '.':
+                elif nextchar.isalpha() and token[-1] == '.':
                     token += nextchar
                     state = 'a.'
                 else:
-                    self.charstack.append(nextchar)
+                    pushback = True
                     break  # emit token
 
-        if (state in ('a.', '0.') and (seenletters or token.count('.') > 1 or
-                                       token[-1] in '.,')):
-            l = self._split_decimal.split(token)
+        if string is not None:
+            self._pos = pos - 1 if pushback else pos
+        elif pushback:
+            self._pushback = nextchar
+
+        if (state in ('a.', '0.') and (seenletters or token[-1] in '.,' or
+                                       token.count('.') > 1)):
+            l = _SPLIT_DECIMAL_RE.split(token)
             token = l[0]
             for tok in l[1:]:
                 if tok:
@@ -198,8 +248,62 @@ class _timelex(object):
 
     @classmethod
     def split(cls, s):
+        if getattr(s, 'read', None) is not None:
+            # Every token is consumed anyway, so read the stream in one call
+            # instead of a character at a time and tokenize the string.
+            s = s.read()
+
+        if isinstance(s, (bytes, bytearray)):
+            s = s.decode()
+
+        if isinstance(s, text_type) and not _NON_ASCII_RE.search(s):
+            return cls._split_ascii(s.replace('\x00', ''))
+
         return list(cls(s))
 
+    @classmethod
+    def _split_ascii(cls, s):
+        """
+        Equivalent to ``list(cls(s))`` for an ASCII string ``s`` without NUL
+        characters, but matching each token with a single regular expression
+        search rather than reading it one character at a time.
+        """
+        tokens = []
+        len_s = len(s)
+        for match in _TIMELEX_ASCII_RE.finditer(s):
+            token, space, other = match.groups()
+            if space is not None:
+                tokens.append(' ')
+                continue
+            elif other is not None:
+                tokens.append(other)
+                continue
+
+            if '.' not in token and ',' not in token:
+                tokens.append(token)
+                continue
+
+            # get_token() only notices it has seen letters when it reads
+            # another character after the first one, which it doesn't do
+            # for a trailing letter at the end of the string.
+            if token[0].isalpha():
+                seenletters = True
+            else:
+                seen = token[:-1] if match.end() == len_s else token
+                seenletters = any(c.isalpha() for c in seen)
+
+            if seenletters or token[-1] in '.,' or token.count('.') > 1:
+                l = _SPLIT_DECIMAL_RE.split(token)
+                tokens.extend(tok for tok in l if tok)
+            elif '.' not in token:
+                tokens.append(token.replace(',', '.'))
+            else:
+                tokens.append(token)
+
+        return tokens
+
+    # get_token() calls the str methods below directly rather than going
+    # through these helpers, which are kept for backwards compatibility.
     @classmethod
     def isword(cls, nextchar):
         """ Whether or not the next character is part of a word """
@@ -216,9 +320,37 @@ class _timelex(object):
         return nextchar.isspace()
 
 
+class _ResultMeta(type):
+    """
+    Gives each result class an ``_init_slots`` method and a ``__len__``,
+    compiled from its ``__slots__``, that set and count them with plain
+    attribute access rather than calling ``setattr``/``getattr`` in a loop.
+    """
+    def __init__(cls, name, bases, dct):
+        super(_ResultMeta, cls).__init__(name, bases, dct)
+
+        if '__slots__' in dct:
+            src = "def _init_slots(self):\n"
+            src += "".join("    self.%s = None\n" % attr
+                           for attr in cls.__slots__)
+            src += "def __len__(self):\n"
+            src += "    return (0%s)\n" % "".join(
+                "\n            + (self.%s is not None)" % attr
+                for attr in cls.__slots__)
+            namespace = {}
+            exec(src, namespace)
+            cls._init_slots = namespace['_init_slots']
+            if '__len__' not in dct:
+                cls.__len__ = namespace['__len__']
+
+
+@six.add_metaclass(_ResultMeta)
 class _resultbase(object):
 
     def __init__(self):
+        self._init_slots()
+
+    def _init_slots(self):
         for attr in self.__slots__:
             setattr(self, attr, None)
 
@@ -238,6 +370,53 @@ class _resultbase(object):
         return self._repr(self.__class__.__name__)
 
 
+# YYYY-MM-DD[(T| )HH:MM[:SS[.ffffff]][Z|(+|-)HH[[:]MM]]], the subset of ISO
+# 8601 that parser._parse() can interpret without tokenizing the string.
+_ISO_FAST_RE = re.compile(r"""
+    ([0-9]{4})-([0-9]{2})-([0-9]{2})
+    (?:[T ]([0-9]{2}):([0-9]{2})
+        (?::([0-9]{2})(?:\.([0-9]+))?)?
+        (?:(Z)|([+-])([0-9]{2})(?::?([0-9]{2}))?)?
+    )?
+    \Z""", re.VERBOSE)
+
+
+# The current local year, along with the time.time() range for which it holds,
+# so that time.localtime() is only called again once the year may have changed.
+_CURRENT_YEAR = (None, 0, 0)
+
+
+def _current_year():
+    global _CURRENT_YEAR
+
+    year, start, end = _CURRENT_YEAR
+    if not start <= time.time() < end:
+        year = time.localtime().tm_year
+        try:
+            start = time.mktime((year, 1, 1, 0, 0, 0, 0, 1, -1))
+            end = time.mktime((year + 1, 1, 1, 0, 0, 0, 0, 1, -1))
+        except (OverflowError, ValueError):
+            start = end = 0
+
+        _CURRENT_YEAR = (year, start, end)
+
+    return year
+
+
+# Lookup tables built by parserinfo._convert, keyed on the word list they were
+# built from. In practice only a handful of distinct lists are ever used, but
+# the least recently used tables are dropped so that lots of dynamically
+# created subclasses can't make it grow without bound.
+_PARSERINFO_TABLES = OrderedDict()
+_PARSERINFO_TABLES_SIZE = 128
+_PARSERINFO_TABLES_LOCK = _thread.allocate_lock()
+
+# The lookups done by parserinfo.classify(), in order of precedence.
+_CLASSIFY_KINDS = ('weekday', 'month', 'ampm', 'jump', 'hms', 'pertain',
+                   'utczone')
+_CLASSIFY_CACHE_SIZE = 512
+
+
 class parserinfo(object):
     """
     Class which handles what inputs are accepted. Subclass this to customize
@@ -292,18 +471,20 @@ class parserinfo(object):
     #              "Anno Domini", "Year of Our Lord"]
 
     def __init__(self, dayfirst=False, yearfirst=False):
-        self._jump = self._convert(self.JUMP)
-        self._weekdays = self._convert(self.WEEKDAYS)
-        self._months = self._convert(self.MONTHS)
-        self._hms = self._convert(self.HMS)
-        self._ampm = self._convert(self.AMPM)
-        self._utczone = self._convert(self.UTCZONE)
-        self._pertain = self._convert(self.PERTAIN)
+        self._jump = self._convert_cached(self.JUMP, keys_only=True)
+        self._weekdays = self._convert_cached(self.WEEKDAYS)
+        self._months = self._convert_cached(self.MONTHS)
+        self._hms = self._convert_cached(self.HMS)
+        self._ampm = self._convert_cached(self.AMPM)
+        self._utczone = self._convert_cached(self.UTCZONE, keys_only=True)
+        self._pertain = self._convert_cached(self.PERTAIN, keys_only=True)
+
+        self._classified = {}
 
         self.dayfirst = dayfirst
         self.yearfirst = yearfirst
 
-        self._year = time.localtime().tm_year
+        self._year = _current_year()
         self._century = self._year // 100 * 100
 
     def _convert(self, lst):
@@ -316,34 +497,56 @@ class parserinfo(object):
                 dct[v.lower()] = i
         return dct
 
+    def _convert_cached(self, lst, keys_only=False):
+        # Instances built from the same lists reuse the same converted
+        # tables. The cache is keyed on the contents of the list, so lists
+        # modified in place are still picked up.
+        #
+        # Tables that are only used for membership tests (keys_only) are
+        # stored as frozensets of the lowercased names and shared outright.
+        # Otherwise, each instance gets its own copy of the dict, which
+        # subclasses are free to modify.
+        if type(self)._convert != parserinfo._convert:
+            return self._convert_table(lst, keys_only)
+
+        key = (keys_only, tuple(lst))
+        with _PARSERINFO_TABLES_LOCK:
+            table = _PARSERINFO_TABLES.pop(key, None)
+            if table is not None:
+                _PARSERINFO_TABLES[key] = table
+
+        if table is None:
+            table = self._convert_table(lst, keys_only)
+            with _PARSERINFO_TABLES_LOCK:
+                _PARSERINFO_TABLES[key] = table
+                if len(_PARSERINFO_TABLES) > _PARSERINFO_TABLES_SIZE:
+                    _PARSERINFO_TABLES.popitem(last=False)
+
+        return table if keys_only else dict(table)
+
+    def _convert_table(self, lst, keys_only):
+        table = self._convert(lst)
+        if keys_only:
+            table = frozenset(table)
+        return table
+
     def jump(self, name):
         return name.lower() in self._jump
 
     def weekday(self, name):
-        try:
-            return self._weekdays[name.lower()]
-        except KeyError:
-            pass
-        return None
+        return self._weekdays.get(name.lower())
 
     def month(self, name):
-        try:
-            return self._months[name.lower()] + 1
-        except KeyError:
-            pass
-        return None
+        value = self._months.get(name.lower())
+        if value is not None:
+            value += 1
+        return value
 
     def hms(self, name):
-        try:
-            return self._hms[name.lower()]
-        except KeyError:
-            return None
+        return self._hms.get(name.lower())
 
     def ampm(self, name):
-        try:
-            return self._ampm[name.lower()]
-        except KeyError:
-            return None
+        return self._ampm.get(name.lower())
 
     def pertain(self, name):
         return name.lower() in self._pertain
@@ -351,6 +554,93 @@ class parserinfo(object):
     def utczone(self, name):
         return name.lower() in self._utczone
 
+    def classify(self, name):
+        """
+        Looks ``name`` up in all of the word lists at once, lowercasing it only
+        a single time.
+
+        :return:
+            Returns a ``(kind, value)`` tuple, where ``kind`` is the name of
+            the first of the :meth:`weekday`, :meth:`month`, :meth:`ampm`,
+            :meth:`jump`, :meth:`hms`, :meth:`pertain` and :meth:`utczone`
+            methods to recognize ``name``, and ``value`` is what that method
+            returns. If none of them do, ``(None, None)`` is returned.
+
+        If a subclass overrides any of those methods, they are called in turn
+        instead.
+
+        .. versionadded:: 2.10.0
+        """
+        if type(self) is not parserinfo and self._overrides_lookups():
+            return self._classify_with_methods(name)
+
+        # The same few words come up over and over again, so remember how
+        # they were classified. The cache is simply emptied when it fills up,
+        # which only happens with a lot of distinct (e.g. fuzzy) input.
+        # Subclasses that don't call parserinfo.__init__ get it on first use.
+        cache = getattr(self, '_classified', None)
+        if cache is None:
+            cache = self._classified = {}
+
+        classified = cache.get(name)
+        if classified is None:
+            if len(cache) >= _CLASSIFY_CACHE_SIZE:
+                cache.clear()
+            classified = cache[name] = self._classify_name(name)
+
+        return classified
+
+    def _classify_name(self, name):
+        lname = name.lower()
+
+        value = self._weekdays.get(lname)
+        if value is not None:
+            return 'weekday', value
+
+        value = self._months.get(lname)
+        if value is not None:
+            return 'month', value + 1
+
+        value = self._ampm.get(lname)
+        if value is not None:
+            return 'ampm', value
+
+        if lname in self._jump:
+            return 'jump', True
+
+        value = self._hms.get(lname)
+        if value is not None:
+            return 'hms', value
+
+        if lname in self._pertain:
+            return 'pertain', True
+
+        if lname in self._utczone:
+            return 'utczone', True
+
+        return None, None
+
+    @classmethod
+    def _overrides_lookups(cls):
+        # Stored on each class itself, so that throwaway subclasses can still
+        # be garbage collected. Look in __dict__ so a subclass doesn't pick up
+        # the flag of its base class.
+        overridden = cls.__dict__.get('_lookups_overridden')
+        if overridden is None:
+            overridden = any(getattr(cls, kind) != getattr(parserinfo, kind)
+                             for kind in _CLASSIFY_KINDS)
+            cls._lookups_overridden = overridden
+
+        return overridden
+
+    def _classify_with_methods(self, name):
+        for kind in _CLASSIFY_KINDS:
+            value = getattr(self, kind)(name)
+            if value is not None and value is not False:
+                return kind, value
+
+        return None, None
+
     def tzoffset(self, name):
         if name in self._utczone:
             return 0
@@ -391,6 +681,20 @@ class parserinfo(object):
         return True
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    """ Equivalent to ``calendar.monthrange(year, month)[1]`` """
+    if month == 2:
+        return 29 if isleap(year) else 28
+    elif 1 <= month <= 12:
+        return _DAYS_IN_MONTH[month - 1]
+
+    # Let calendar raise its usual error for an invalid month
+    return monthrange(year, month)[1]
+
+
 class _ymd(list):
     def __init__(self, *args, **kwargs):
         super(self.__class__, self).__init__(*args, **kwargs)
@@ -419,26 +723,36 @@ class _ymd(list):
         elif not self.has_year:
             # Be permissive, assume leap year
             month = self[self.mstridx]
-            return 1 <= value <= monthrange(2000, month)[1]
+            return 1 <= value <= _days_in_month(2000, month)
         else:
             month = self[self.mstridx]
             year = self[self.ystridx]
-            return 1 <= value <= monthrange(year, month)[1]
+            return 1 <= value <= _days_in_month(year, month)
 
     def append(self, val, label=None):
-        if hasattr(val, '__len__'):
-            if val.isdigit() and len(val) > 2:
-                self.century_specified = True
-                if label not in [None, 'Y']:  # pragma: no cover
-                    raise ValueError(label)
-                label = 'Y'
-        elif val > 100:
+        if isinstance(val, (text_type, bytes)):
+            century_specified = val.isdigit() and len(val) > 2
+        else:
+            century_specified = val > 100
+
+        self._append(int(val), label, century_specified)
+
+    def append_int(self, val, label=None):
+        """ Like :meth:`append`, for a value that is already an integer """
+        self._append(val, label, val > 100)
+
+    def append_numtok(self, token, label=None):
+        """ Like :meth:`append`, for a string token of digits """
+        self._append(int(token), label, len(token) > 2)
+
+    def _append(self, val, label, century_specified):
+        if century_specified:
             self.century_specified = True
             if label not in [None, 'Y']:  # pragma: no cover
                 raise ValueError(label)
             label = 'Y'
 
-        super(self.__class__, self).append(int(val))
+        super(_ymd, self).append(val)
 
         if label == 'M':
             if self.has_month:
@@ -475,11 +789,13 @@ class _ymd(list):
         len_ymd = len(self)
         year, month, day = (None, None, None)
 
-        strids = (('y', self.ystridx),
-                  ('m', self.mstridx),
-                  ('d', self.dstridx))
-
-        strids = {key: val for key, val in strids if val is not None}
+        strids = {}
+        if self.ystridx is not None:
+            strids['y'] = self.ystridx
+        if self.mstridx is not None:
+            strids['m'] = self.mstridx
+        if self.dstridx is not None:
+            strids['d'] = self.dstridx
         if (len(self) == len(strids) > 0 or
                 (len(self) == 3 and len(strids) == 2)):
             return self._resolve_from_stridxs(strids)
@@ -565,6 +881,13 @@ class _ymd(list):
         return year, month, day
 
 
+# Characters allowed in an unknown timezone abbreviation like "BRST"
+_ASCII_UPPERCASE = frozenset(string.ascii_uppercase)
+
+# Stand-in default for strings that specify a full date
+_MIDNIGHT = datetime.datetime(2000, 1, 1)
+
+
 class parser(object):
     def __init__(self, info=None):
         self.info = info or parserinfo()
@@ -633,18 +956,32 @@ class parser(object):
             your system.
         """
 
-        if default is None:
-            default = datetime.datetime.now().replace(hour=0, minute=0,
-                                                      second=0, microsecond=0)
-
         res, skipped_tokens = self._parse(timestr, **kwargs)
 
+        return self._build_result(timestr, res, skipped_tokens, default,
+                                  ignoretz, tzinfos,
+                                  kwargs.get('fuzzy_with_tokens', False))
+
+    def _build_result(self, timestr, res, skipped_tokens, default, ignoretz,
+                      tzinfos, fuzzy_with_tokens):
+        # Builds the return value of parse() from the output of _parse(),
+        # which it does not modify.
         if res is None:
             raise ParserError("Unknown string format: %s", timestr)
 
         if len(res) == 0:
             raise ParserError("String does not contain a date: %s", timestr)
 
+        if default is None:
+            if (res.year is not None and res.month is not None and
+                    res.day is not None):
+                # Only the zeroed time fields of the default can end up in
+                # the result, so don't bother asking for the current date.
+                default = _MIDNIGHT
+            else:
+                default = datetime.datetime.now().replace(
+                    hour=0, minute=0, second=0, microsecond=0)
+
         try:
             ret = self._build_naive(res, default)
         except ValueError as e:
@@ -653,7 +990,7 @@ class parser(object):
         if not ignoretz:
             ret = self._build_tzaware(ret, res, tzinfos)
 
-        if kwargs.get('fuzzy_with_tokens', False):
+        if fuzzy_with_tokens:
             return ret, skipped_tokens
         else:
             return ret
@@ -715,6 +1052,14 @@ class parser(object):
         if yearfirst is None:
             yearfirst = info.yearfirst
 
+        if (not fuzzy and type(self) is parser and type(info) is parserinfo and
+                isinstance(timestr, text_type)):
+            res = self._parse_iso_fast(timestr, dayfirst)
+            if res is not None:
+                if not info.validate(res):
+                    return None, None
+                return res, None
+
         res = self._result()
         l = _timelex.split(timestr)         # Splits the timestr into tokens
 
@@ -723,41 +1068,54 @@ class parser(object):
         # year/month/day list
         ymd = _ymd()
 
+        # Bound methods used for (almost) every token
+        classify = info.classify
+        could_be_tzname = self._could_be_tzname
+        parse_numeric_token = self._parse_numeric_token
+
         len_l = len(l)
         i = 0
         try:
             while i < len_l:
 
-                # Check if it's a number
+                # Check if it's a number. Of the tokens _timelex produces,
+                # float() can only accept ones starting with a digit, or the
+                # words nan and inf(inity), so don't try it on anything else.
                 value_repr = l[i]
-                try:
-                    value = float(value_repr)
-                except ValueError:
-                    value = None
+                value = None
+                if value_repr[0].isdigit() or value_repr[0] in 'nNiI':
+                    try:
+                        value = float(value_repr)
+                    except ValueError:
+                        pass
 
                 if value is not None:
+                    kind = 'number'
+                else:
+                    # Otherwise, look it up in the parserinfo word lists
+                    kind, value = classify(value_repr)
+
+                if kind == 'number':
                     # Numeric token
-                    i = self._parse_numeric_token(l, i, info, ymd, res, fuzzy)
+                    i = parse_numeric_token(l, i, info, ymd, res, fuzzy)
 
                 # Check weekday
-                elif info.weekday(l[i]) is not None:
-                    value = info.weekday(l[i])
+                elif kind == 'weekday':
                     res.weekday = value
 
                 # Check month name
-                elif info.month(l[i]) is not None:
-                    value = info.month(l[i])
-                    ymd.append(value, 'M')
+                elif kind == 'month':
+                    ymd.append_int(value, 'M')
 
                     if i + 1 < len_l:
                         if l[i + 1] in ('-', '/'):
                             # Jan-01[-99]
                             sep = l[i + 1]
-                            ymd.append(l[i + 2])
+                            ymd.append_numtok(l[i + 2])
 
                             if i + 3 < len_l and l[i + 3] == sep:
                                 # Jan-01-99
-                                ymd.append(l[i + 4])
+                                ymd.append_numtok(l[i + 4])
                                 i += 2
 
                             i += 2
@@ -778,8 +1136,7 @@ class parser(object):
                             i += 4
 
                 # Check am/pm
-                elif info.ampm(l[i]) is not None:
-                    value = info.ampm(l[i])
+                elif kind == 'ampm':
                     val_is_ampm = self._ampm_valid(res.hour, res.ampm, fuzzy)
 
                     if val_is_ampm:
@@ -790,8 +1147,9 @@ class parser(object):
                         skipped_idxs.append(i)
 
                 # Check for a timezone name
-                elif self._could_be_tzname(res.hour, res.tzname, res.tzoffset, l[i]):
-                    res.tzname = l[i]
+                elif could_be_tzname(res.hour, res.tzname, res.tzoffset,
+                                     value_repr):
+                    res.tzname = value_repr
                     res.tzoffset = info.tzoffset(res.tzname)
 
                     # Check for something like GMT+3, or BRST+3. Notice
@@ -808,8 +1166,8 @@ class parser(object):
                             res.tzname = None
 
                 # Check for a numbered timezone
-                elif res.hour is not None and l[i] in ('+', '-'):
-                    signal = (-1, 1)[l[i] == '+']
+                elif res.hour is not None and value_repr in ('+', '-'):
+                    signal = 1 if value_repr == '+' else -1
                     len_li = len(l[i + 1])
 
                     # TODO: check that l[i + 1] is integer?
@@ -836,8 +1194,8 @@ class parser(object):
                             info.jump(l[i + 2]) and l[i + 3] == '(' and
                             l[i + 5] == ')' and
                             3 <= len(l[i + 4]) and
-                            self._could_be_tzname(res.hour, res.tzname,
-                                                  None, l[i + 4])):
+                            could_be_tzname(res.hour, res.tzname,
+                                            None, l[i + 4])):
                         # -0300 (BRST)
                         res.tzname = l[i + 4]
                         i += 4
@@ -845,7 +1203,7 @@ class parser(object):
                     i += 1
 
                 # Check jumps
-                elif not (info.jump(l[i]) or fuzzy):
+                elif not (kind == 'jump' or fuzzy):
                     raise ValueError(timestr)
 
                 else:
@@ -872,6 +1230,48 @@ class parser(object):
         else:
             return res, None
 
+    def _parse_iso_fast(self, timestr, dayfirst):
+        """
+        Interprets strings matching ``_ISO_FAST_RE`` exactly as the token loop
+        in ``_parse()`` would, without tokenizing them. Returns ``None`` for
+        any other string.
+        """
+        match = _ISO_FAST_RE.match(timestr)
+        if match is None:
+            return None
+
+        (year, month, day, hour, minute, second, fraction,
+         utc, sign, tzhour, tzminute) = match.groups()
+
+        res = self._result()
+
+        # The four digit year fixes the order to year, month, day, except
+        # that dayfirst swaps month and day where possible.
+        res.century_specified = True
+        res.year = int(year)
+        res.month = int(month)
+        res.day = int(day)
+        if dayfirst and res.day <= 12:
+            res.month, res.day = res.day, res.month
+
+        if hour is not None:
+            res.hour = int(hour)
+            res.minute = int(minute)
+
+            if second is not None:
+                res.second = int(second)
+                res.microsecond = int(fraction[:6].ljust(6, "0") if fraction
+                                      else 0)
+
+            if utc is not None:
+                res.tzname = utc
+                res.tzoffset = self.info.tzoffset(utc)
+            elif sign is not None:
+                offset = int(tzhour) * 3600 + int(tzminute or 0) * 60
+                res.tzoffset = -offset if sign == '-' else offset
+
+        return res
+
     def _parse_numeric_token(self, tokens, idx, info, ymd, res, fuzzy):
         # Token is a number
         value_repr = tokens[idx]
@@ -884,26 +1284,31 @@ class parser(object):
 
         len_l = len(tokens)
 
+        # The following two tokens, or None past the end of the list
+        nxt = tokens[idx + 1] if idx + 1 < len_l else None
+        nxt2 = tokens[idx + 2] if idx + 2 < len_l else None
+
         if (len(ymd) == 3 and len_li in (2, 4) and
             res.hour is None and
-            (idx + 1 >= len_l or
-             (tokens[idx + 1] != ':' and
-              info.hms(tokens[idx + 1]) is None))):
+            (nxt is None or
+             (nxt != ':' and info.hms(nxt) is None))):
             # 19990101T23[59]
-            s = tokens[idx]
+            s = value_repr
             res.hour = int(s[:2])
 
             if len_li == 4:
                 res.minute = int(s[2:])
 
-        elif len_li == 6 or (len_li > 6 and tokens[idx].find('.') == 6):
+        elif len_li == 6 or (len_li > 6 and value_repr.find('.') == 6):
             # YYMMDD or HHMMSS[.ss]
-            s = tokens[idx]
-
-            if not ymd and '.' not in tokens[idx]:
-                ymd.append(s[:2])
-                ymd.append(s[2:4])
-                ymd.append(s[4:])
+            s = value_repr
+
+            if not ymd and '.' not in s:
+                n, third = divmod(int(s), 100)
+                first, second = divmod(n, 100)
+                ymd.append_int(first)
+                ymd.append_int(second)
+                ymd.append_int(third)
             else:
                 # 19990101T235959[.59]
 
@@ -914,10 +1319,12 @@ class parser(object):
 
         elif len_li in (8, 12, 14):
             # YYYYMMDD
-            s = tokens[idx]
-            ymd.append(s[:4], 'Y')
-            ymd.append(s[4:6])
-            ymd.append(s[6:8])
+            s = value_repr
+            # The year keeps its four digits, so is always century-specified
+            ymd.append_numtok(s[:4], 'Y')
+            month, day = divmod(int(s[4:8]), 100)
+            ymd.append_int(month)
+            ymd.append_int(day)
 
             if len_li > 8:
                 res.hour = int(s[8:10])
@@ -935,10 +1342,10 @@ class parser(object):
                 # already set?
                 self._assign_hms(res, value_repr, hms)
 
-        elif idx + 2 < len_l and tokens[idx + 1] == ':':
+        elif nxt2 is not None and nxt == ':':
             # HH:MM[:SS[.ss]]
             res.hour = int(value)
-            value = self._to_decimal(tokens[idx + 2])  # TODO: try/except for this?
+            value = self._to_decimal(nxt2)  # TODO: try/except for this?
             (res.minute, res.second) = self._parse_min_sec(value)
 
             if idx + 4 < len_l and tokens[idx + 3] == ':':
@@ -948,20 +1355,20 @@ class parser(object):
 
             idx += 2
 
-        elif idx + 1 < len_l and tokens[idx + 1] in ('-', '/', '.'):
-            sep = tokens[idx + 1]
-            ymd.append(value_repr)
+        elif nxt in ('-', '/', '.'):
+            sep = nxt
+            ymd.append_numtok(value_repr)
 
-            if idx + 2 < len_l and not info.jump(tokens[idx + 2]):
-                if tokens[idx + 2].isdigit():
+            if nxt2 is not None and not info.jump(nxt2):
+                if nxt2.isdigit():
                     # 01-01[-01]
-                    ymd.append(tokens[idx + 2])
+                    ymd.append_numtok(nxt2)
                 else:
                     # 01-Jan[-01]
-                    value = info.month(tokens[idx + 2])
+                    value = info.month(nxt2)
 
                     if value is not None:
-                        ymd.append(value, 'M')
+                        ymd.append_int(value, 'M')
                     else:
                         raise ValueError()
 
@@ -970,36 +1377,40 @@ class parser(object):
                     value = info.month(tokens[idx + 4])
 
                     if value is not None:
-                        ymd.append(value, 'M')
+                        ymd.append_int(value, 'M')
                     else:
-                        ymd.append(tokens[idx + 4])
+                        ymd.append_numtok(tokens[idx + 4])
                     idx += 2
 
                 idx += 1
             idx += 1
 
-        elif idx + 1 >= len_l or info.jump(tokens[idx + 1]):
-            if idx + 2 < len_l and info.ampm(tokens[idx + 2]) is not None:
+        elif nxt is None or info.jump(nxt):
+            ampm = info.ampm(nxt2) if nxt2 is not None else None
+            if ampm is not None:
                 # 12 am
                 hour = int(value)
-                res.hour = self._adjust_ampm(hour, info.ampm(tokens[idx + 2]))
+                res.hour = self._adjust_ampm(hour, ampm)
                 idx += 1
             else:
                 # Year, month or day
                 ymd.append(value)
             idx += 1
 
-        elif info.ampm(tokens[idx + 1]) is not None and (0 <= value < 24):
-            # 12am
-            hour = int(value)
-            res.hour = self._adjust_ampm(hour, info.ampm(tokens[idx + 1]))
-            idx += 1
+        else:
+            ampm = info.ampm(nxt)
+
+            if ampm is not None and (0 <= value < 24):
+                # 12am
+                hour = int(value)
+                res.hour = self._adjust_ampm(hour, ampm)
+                idx += 1
 
-        elif ymd.could_be_day(value):
-            ymd.append(value)
+            elif ymd.could_be_day(value):
+                ymd.append(value)
 
-        elif not fuzzy:
-            raise ValueError()
+            elif not fuzzy:
+                raise ValueError()
 
         return idx
 
@@ -1058,7 +1469,7 @@ class parser(object):
                 tzname is None and
                 tzoffset is None and
                 len(token) <= 5 and
-                (all(x in string.ascii_uppercase for x in token)
+                (_ASCII_UPPERCASE.issuperset(token)
                  or token in self.info.UTCZONE))
 
     def _ampm_valid(self, hour, ampm, fuzzy):
@@ -1229,8 +1640,9 @@ class parser(object):
             cmonth = default.month if res.month is None else res.month
             cday = default.day if res.day is None else res.day
 
-            if cday > monthrange(cyear, cmonth)[1]:
-                repl['day'] = monthrange(cyear, cmonth)[1]
+            last_day = _days_in_month(cyear, cmonth)
+            if cday > last_day:
+                repl['day'] = last_day
 
         naive = default.replace(**repl)
 
@@ -1254,14 +1666,18 @@ class parser(object):
         >>> _recombine_skipped(tokens, skipped_idxs)
         ["foo bar", "baz"]
         """
-        skipped_tokens = []
-        for i, idx in enumerate(sorted(skipped_idxs)):
-            if i > 0 and idx - 1 == skipped_idxs[i - 1]:
-                skipped_tokens[-1] = skipped_tokens[-1] + tokens[idx]
+        # _parse appends to skipped_idxs as it walks the tokens, so the
+        # indices are already in ascending order.
+        runs = []
+        prev = None
+        for idx in skipped_idxs:
+            if idx - 1 == prev:
+                runs[-1].append(tokens[idx])
             else:
-                skipped_tokens.append(tokens[idx])
+                runs.append([tokens[idx]])
+            prev = idx
 
-        return skipped_tokens
+        return [''.join(run) for run in runs]
 
 
 DEFAULTPARSER = parser()
@@ -1368,6 +1784,57 @@ def parse(timestr, parserinfo=None, **kwargs):
         return DEFAULTPARSER.parse(timestr, **kwargs)
 
 
+# Most recently used _parse() results for parse_cached(), oldest first
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 1024
+_PARSE_CACHE_LOCK = _thread.allocate_lock()
+
+
+def parse_cached(timestr, default=None, ignoretz=False, tzinfos=None,
+                 **kwargs):
+    """
+    Equivalent to :func:`parse` with the default :class:`parserinfo`, but
+    remembering how the 1024 most recently used strings were interpreted, for
+    when the same strings are parsed over and over again (e.g. timestamps
+    repeated across the rows of a file).
+
+    Only the interpretation of ``timestr`` is cached, keyed on ``timestr``
+    and the ``dayfirst``, ``yearfirst``, ``fuzzy`` and ``fuzzy_with_tokens``
+    arguments. The ``default``, ``ignoretz`` and ``tzinfos`` arguments are
+    applied on every call, so a new :class:`datetime.datetime` is returned
+    each time. The cache is shared between threads.
+
+    Arguments and return value are as for :func:`parse`; input other than
+    strings is parsed without caching.
+
+    .. versionadded:: 2.10.0
+    """
+    if not isinstance(timestr, (text_type, bytes)):
+        return DEFAULTPARSER.parse(timestr, default=default,
+                                   ignoretz=ignoretz, tzinfos=tzinfos,
+                                   **kwargs)
+
+    key = (timestr, tuple(sorted(kwargs.items())))
+    with _PARSE_CACHE_LOCK:
+        parsed = _PARSE_CACHE.pop(key, None)
+        if parsed is not None:
+            _PARSE_CACHE[key] = parsed
+
+    if parsed is None:
+        parsed = DEFAULTPARSER._parse(timestr, **kwargs)
+
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = parsed
+
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+    res, skipped_tokens = parsed
+    return DEFAULTPARSER._build_result(timestr, res, skipped_tokens, default,
+                                      ignoretz, tzinfos,
+                                      kwargs.get('fuzzy_with_tokens', False))
+
+
 class _tzparser(object):
 
     class _result(_resultbase):
@@ -1389,7 +1856,7 @@ class _tzparser(object):
 
     def parse(self, tzstr):
         res = self._result()
-        l = [x for x in re.split(r'([,:.]|[a-zA-Z]+|[0-9]+)',tzstr) if x]
+        l = [x for x in _TZPARSER_SPLIT_RE.split(tzstr) if x]
         used_idxs = list()
         try:
 
@@ -1399,8 +1866,7 @@ class _tzparser(object):
             while i < len_l:
                 # BRST+3[BRDT[+2]]
                 j = i
-                while j < len_l and not [x for x in l[j]
-                                         if x in "0123456789:,-+"]:
+                while j < len_l and _TZPARSER_NUMERIC.isdisjoint(l[j]):
                     j += 1
                 if j != i:
                     if not res.stdabbr:
@@ -1418,7 +1884,7 @@ class _tzparser(object):
                         if l[i] in ('+', '-'):
                             # Yes, that's right.  See the TZ variable
                             # documentation.
-                            signal = (1, -1)[l[i] == '+']
+                            signal = -1 if l[i] == '+' else 1
                             used_idxs.append(i)
                             i += 1
                         else:
@@ -1488,7 +1954,7 @@ class _tzparser(object):
                     i += 2
                 if i < len_l:
                     if l[i] in ('-', '+'):
-                        signal = (-1, 1)[l[i] == "+"]
+                        signal = 1 if l[i] == "+" else -1
                         used_idxs.append(i)
                         i += 1
                     else:
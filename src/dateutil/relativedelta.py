@@ -374,22 +374,30 @@ class relativedelta(object):
             elif month < 1:
                 year -= 1
                 month += 12
-        day = min(calendar.monthrange(year, month)[1],
-                  self.day or other.day)
+        day = self.day or other.day
+        if day > 28:
+            day = min(calendar.monthrange(year, month)[1], day)
         repl = {"year": year, "month": month, "day": day}
-        for attr in ["hour", "minute", "second", "microsecond"]:
-            value = getattr(self, attr)
-            if value is not None:
-                repl[attr] = value
+        if self.hour is not None:
+            repl["hour"] = self.hour
+        if self.minute is not None:
+            repl["minute"] = self.minute
+        if self.second is not None:
+            repl["second"] = self.second
+        if self.microsecond is not None:
+            repl["microsecond"] = self.microsecond
         days = self.days
         if self.leapdays and month > 2 and calendar.isleap(year):
             days += self.leapdays
-        ret = (other.replace(**repl)
-               + datetime.timedelta(days=days,
-                                    hours=self.hours,
-                                    minutes=self.minutes,
-                                    seconds=self.seconds,
-                                    microseconds=self.microseconds))
+        ret = other.replace(**repl)
+        if self.hours or self.minutes or self.seconds or self.microseconds:
+            ret += datetime.timedelta(days=days,
+                                      hours=self.hours,
+                                      minutes=self.minutes,
+                                      seconds=self.seconds,
+                                      microseconds=self.microseconds)
+        elif days:
+            ret += datetime.timedelta(days=days)
         if self.weekday:
             weekday, nth = self.weekday.weekday, self.weekday.n or 1
             jumpdays = (abs(nth) - 1) * 7
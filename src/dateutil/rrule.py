@@ -5,7 +5,9 @@ the recurrence rules documented in the
 `iCalendar RFC <https://tools.ietf.org/html/rfc5545>`_,
 including support for caching of results.
 """
+import bisect
 import calendar
+import copy
 import datetime
 import heapq
 import itertools
@@ -110,6 +112,11 @@ class rrulebase(object):
         else:
             return self._iter_cached()
 
+    def _iter_after(self, dt):
+        """ Iterates over the occurrences, possibly skipping some of those
+            which come before dt. """
+        return iter(self)
+
     def _invalidate_cache(self):
         if self._cache is not None:
             self._cache = []
@@ -193,9 +200,14 @@ class rrulebase(object):
             inc keyword defines what happens if dt is an occurrence. With
             inc=True, if dt itself is an occurrence, it will be returned. """
         if self._cache_complete:
-            gen = self._cache
-        else:
-            gen = self
+            # The cache is sorted, so it can be bisected directly.
+            if inc:
+                i = bisect.bisect_right(self._cache, dt)
+            else:
+                i = bisect.bisect_left(self._cache, dt)
+            return self._cache[i-1] if i else None
+
+        gen = self
         last = None
         if inc:
             for i in gen:
@@ -214,9 +226,13 @@ class rrulebase(object):
             inc keyword defines what happens if dt is an occurrence. With
             inc=True, if dt itself is an occurrence, it will be returned.  """
         if self._cache_complete:
-            gen = self._cache
-        else:
-            gen = self
+            if inc:
+                i = bisect.bisect_left(self._cache, dt)
+            else:
+                i = bisect.bisect_right(self._cache, dt)
+            return self._cache[i] if i < len(self._cache) else None
+
+        gen = self._iter_after(dt)
         if inc:
             for i in gen:
                 if i >= dt:
@@ -249,7 +265,7 @@ class rrulebase(object):
         if self._cache_complete:
             gen = self._cache
         else:
-            gen = self
+            gen = self._iter_after(dt)
 
         # Select the comparison function
         if inc:
@@ -274,9 +290,15 @@ class rrulebase(object):
         themselves occurrences. With inc=True, they will be included in the
         list, if they are found in the recurrence set. """
         if self._cache_complete:
-            gen = self._cache
-        else:
-            gen = self
+            if inc:
+                start = bisect.bisect_left(self._cache, after)
+                end = bisect.bisect_right(self._cache, before)
+            else:
+                start = bisect.bisect_right(self._cache, after)
+                end = bisect.bisect_left(self._cache, before)
+            return self._cache[start:end]
+
+        gen = self._iter_after(after)
         started = False
         l = []
         if inc:
@@ -773,10 +795,73 @@ class rrule(rrulebase):
         new_kwargs.update(kwargs)
         return rrule(**new_kwargs)
 
-    def _iter(self):
+    def _iter_after(self, dt):
+        # Skipping ahead is only possible when no state carries over from
+        # one period to the next, i.e. no COUNT and no BYSETPOS, and for the
+        # frequencies whose periods are whole days. Cached rules are iterated
+        # normally so that the queries keep filling the cache, and anything
+        # but a datetime is left for the comparisons to reject.
+        if (self._cache is not None or
+                self._count is not None or self._bysetpos or
+                self._freq > DAILY or
+                not isinstance(dt, datetime.datetime) or
+                (dt.tzinfo is None) != (self._dtstart.tzinfo is None)):
+            return iter(self)
+
+        # _iter() records the length of the whole rule when it finishes,
+        # which would be wrong here, so run it on a copy.
+        return copy.copy(self)._iter(skip_to=dt)
+
+    def __skip_periods(self, skip_to, year, month, day, weekday):
+        """
+        Returns the ``(year, month, day, weekday)`` iteration state advanced
+        by a whole number of periods, such that every skipped period ends
+        before ``skip_to``. One extra period is kept as a safety margin.
+        """
+        freq = self._freq
+        interval = self._interval
+        if self._dtstart.tzinfo is not None:
+            skip_to = skip_to.astimezone(self._dtstart.tzinfo)
+        target = skip_to.date()
+
+        if freq == YEARLY:
+            n = (target.year - year)//interval - 1
+            if n > 0:
+                year += n*interval
+        elif freq == MONTHLY:
+            n = ((target.year - year)*12 + target.month - month)//interval - 1
+            if n > 0:
+                year, month = divmod(year*12 + month - 1 + n*interval, 12)
+                month += 1
+        else:
+            # Work on ordinals: in the first week, wkst can fall before
+            # date.min. Any skipped-to day lies between dtstart and target.
+            start = datetime.date(year, month, day).toordinal()
+            if freq == WEEKLY:
+                # Periods after the first one start on wkst.
+                start -= (weekday - self._wkst) % 7
+                step = 7*interval
+            else:
+                step = interval
+
+            n = (target.toordinal() - start)//step - 1
+            if n > 0:
+                start = datetime.date.fromordinal(start + n*step)
+                year, month, day = start.year, start.month, start.day
+                if freq == WEEKLY:
+                    weekday = self._wkst
+
+        return year, month, day, weekday
+
+    def _iter(self, skip_to=None):
         year, month, day, hour, minute, second, weekday, yearday, _ = \
             self._dtstart.timetuple()
 
+        if skip_to is not None:
+            year, month, day, weekday = self.__skip_periods(skip_to, year,
+                                                            month, day,
+                                                            weekday)
+
         # Some local variables to speed things up a bit
         freq = self._freq
         interval = self._interval
@@ -850,19 +935,22 @@ class rrule(rrulebase):
             if bysetpos and timeset:
                 poslist = []
                 for pos in bysetpos:
+                    # Walk the period from whichever end is closer to the
+                    # requested position, stopping as soon as it is reached.
                     if pos < 0:
                         daypos, timepos = divmod(pos, len(timeset))
+                        daypos = -daypos - 1
+                        days = (dayset[x] for x in range(end-1, start-1, -1))
                     else:
                         daypos, timepos = divmod(pos-1, len(timeset))
-                    try:
-                        i = [x for x in dayset[start:end]
-                             if x is not None][daypos]
-                        time = timeset[timepos]
-                    except IndexError:
-                        pass
-                    else:
+                        days = itertools.islice(dayset, start, end)
+
+                    i = next(itertools.islice(
+                        (x for x in days if x is not None), daypos, None),
+                        None)
+                    if i is not None:
                         date = datetime.date.fromordinal(ii.yearordinal+i)
-                        res = datetime.datetime.combine(date, time)
+                        res = datetime.datetime.combine(date, timeset[timepos])
                         if res not in poslist:
                             poslist.append(res)
                 poslist.sort()
@@ -1413,6 +1501,7 @@ class rruleset(rrulebase):
         self._len = total
 
 
+_TZID_RE = re.compile(r'TZID=(?P<name>[^:]+):')
 
 
 class _rrulestr(object):
@@ -1561,7 +1650,7 @@ class _rrulestr(object):
         return rrule(dtstart=dtstart, cache=cache, **rrkwargs)
 
     def _parse_date_value(self, date_value, parms, rule_tzids,
-                          ignoretz, tzids, tzinfos):
+                          ignoretz, tzids, tzinfos, tzid_cache=None):
         global parser
         if not parser:
             from dateutil import parser
@@ -1576,6 +1665,13 @@ class _rrulestr(object):
                     tzkey = rule_tzids[parm.split('TZID=')[-1]]
                 except KeyError:
                     continue
+
+                # The same TZID is usually repeated on every DTSTART/EXDATE
+                # line, so only look it up once per parsed string.
+                if tzid_cache is not None and tzkey in tzid_cache:
+                    TZID = tzid_cache[tzkey]
+                    continue
+
                 if tzids is None:
                     from . import tz
                     tzlookup = tz.gettz
@@ -1589,6 +1685,8 @@ class _rrulestr(object):
                         raise ValueError(msg)
 
                 TZID = tzlookup(tzkey)
+                if tzid_cache is not None:
+                    tzid_cache[tzkey] = TZID
                 continue
 
             # RFC 5445 3.8.2.4: The VALUE parameter is optional, but may be found
@@ -1628,8 +1726,9 @@ class _rrulestr(object):
 
         TZID_NAMES = dict(map(
             lambda x: (x.upper(), x),
-            re.findall('TZID=(?P<name>[^:]+):', s)
+            _TZID_RE.findall(s)
         ))
+        tzid_cache = {}
         s = s.upper()
         if not s.strip():
             raise ValueError("empty string")
@@ -1687,11 +1786,12 @@ class _rrulestr(object):
                     exdatevals.extend(
                         self._parse_date_value(value, parms,
                                                TZID_NAMES, ignoretz,
-                                               tzids, tzinfos)
+                                               tzids, tzinfos, tzid_cache)
                     )
                 elif name == "DTSTART":
                     dtvals = self._parse_date_value(value, parms, TZID_NAMES,
-                                                    ignoretz, tzids, tzinfos)
+                                                    ignoretz, tzids, tzinfos,
+                                                    tzid_cache)
                     if len(dtvals) != 1:
                         raise ValueError("Multiple DTSTART values specified:" +
                                          value)
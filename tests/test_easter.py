@@ -1,7 +1,7 @@
-from dateutil.easter import easter
+from dateutil.easter import easter, easter_array, easter_offset, easter_ordinal
 from dateutil.easter import EASTER_WESTERN, EASTER_ORTHODOX, EASTER_JULIAN
 
-from datetime import date
+from datetime import date, timedelta
 import pytest
 
 # List of easters between 1990 and 2050
@@ -91,3 +91,183 @@ def test_easter_julian(easter_date):
 def test_easter_bad_method():
     with pytest.raises(ValueError):
         easter(1975, 4)
+
+
+def test_easter_cached():
+    assert easter(2021) is easter(2021)
+    assert easter(2021, EASTER_ORTHODOX) is easter(2021, EASTER_ORTHODOX)
+    assert easter(2021) != easter(2021, EASTER_ORTHODOX)
+
+
+def test_easter_cache_hit_skips_computation(monkeypatch):
+    import dateutil.easter as easter_module
+
+    first = easter(2021)
+
+    def fail(*args):
+        raise AssertionError("cached result was recomputed")
+
+    monkeypatch.setattr(easter_module, "_EASTER_METHODS", (fail,) * 3)
+    monkeypatch.setattr(easter_module, "_as_int", fail)
+
+    assert easter(2021) is first
+    assert easter(2021.0) is first
+    assert easter(2021, 3.0) is first
+
+
+@pytest.mark.parametrize("args,expected", [
+    ((2021.0,), date(2021, 4, 4)),
+    ((2021.0, 2), date(2021, 5, 2)),
+    ((1999, 3.0), date(1999, 4, 4)),
+])
+def test_easter_integral_float(args, expected):
+    # Must not depend on whether the equal int arguments were cached first
+    from dateutil.easter import _easter_cache
+    _easter_cache.clear()
+    assert easter(*args) == expected
+    assert easter(*args) == expected
+    assert easter_ordinal(*args) == expected.toordinal()
+
+
+@pytest.mark.parametrize("func", [easter, easter_ordinal])
+@pytest.mark.parametrize("args,exc", [
+    ((2021.5,), ValueError),
+    ((2021, 2.5), ValueError),
+    (('2021',), TypeError),
+    ((2021, '2'), TypeError),
+    ((b'2021',), TypeError),
+])
+def test_easter_non_integral(func, args, exc):
+    with pytest.raises(exc):
+        func(*args)
+
+
+def test_easter_bad_method_not_cached():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            easter(1975, 0)
+
+
+@pytest.mark.parametrize("method,easter_dates", [
+    (EASTER_WESTERN, western_easter_dates),
+    (EASTER_ORTHODOX, orthodox_easter_dates),
+    (EASTER_JULIAN, julian_easter_dates),
+])
+def test_easter_ordinal(method, easter_dates):
+    for easter_date in easter_dates:
+        assert (easter_ordinal(easter_date.year, method) ==
+                easter_date.toordinal())
+
+
+@pytest.mark.parametrize("method", [EASTER_WESTERN, EASTER_ORTHODOX,
+                                    EASTER_JULIAN])
+def test_easter_ordinal_full_range(method):
+    for year in range(1, 10000):
+        try:
+            expected = easter(year, method).toordinal()
+        except ValueError:
+            # e.g. 31 June, in some far future Orthodox years
+            with pytest.raises(ValueError):
+                easter_ordinal(year, method)
+        else:
+            assert easter_ordinal(year, method) == expected
+
+
+def test_easter_ordinal_bad_year():
+    with pytest.raises(ValueError):
+        easter_ordinal(0)
+
+
+@pytest.mark.parametrize("days", [-47, -2, 0, 1, 39, 49])
+@pytest.mark.parametrize("method", [EASTER_WESTERN, EASTER_ORTHODOX])
+def test_easter_offset(days, method):
+    expected = easter(2024, method) + timedelta(days=days)
+    assert easter_offset(2024, days, method) == expected
+
+
+@pytest.mark.parametrize("method,easter_dates", [
+    (EASTER_WESTERN, western_easter_dates),
+    (EASTER_ORTHODOX, orthodox_easter_dates),
+    (EASTER_JULIAN, julian_easter_dates),
+])
+def test_easter_array(method, easter_dates):
+    np = pytest.importorskip("numpy")
+
+    years = [d.year for d in easter_dates]
+    expected = np.array(easter_dates, dtype='datetime64[D]')
+    assert (easter_array(years, method) == expected).all()
+
+
+@pytest.mark.parametrize("make_years", [list, tuple, iter])
+def test_easter_array_iterables(make_years):
+    np = pytest.importorskip("numpy")
+
+    years = range(1990, 2051)
+    expected = np.array(western_easter_dates, dtype='datetime64[D]')
+    assert (easter_array(years) == expected).all()
+    assert (easter_array(make_years(years)) == expected).all()
+
+
+def test_easter_array_bad_method():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        easter_array([1975], 4)
+
+
+@pytest.mark.parametrize("method,exc", [
+    (2.5, ValueError),
+    ('2', TypeError),
+])
+def test_easter_array_non_integral_method(method, exc):
+    pytest.importorskip("numpy")
+    with pytest.raises(exc):
+        easter_array([1975], method)
+
+
+def test_easter_array_integral_float():
+    np = pytest.importorskip("numpy")
+    expected = np.array([date(2021, 4, 4), date(2021, 5, 2)],
+                        dtype='datetime64[D]')
+    assert (easter_array([2021.0]) == expected[0]).all()
+    assert (easter_array(np.array([2021.0]), 2.0) == expected[1]).all()
+
+
+@pytest.mark.parametrize("make_years,exc", [
+    (lambda np: [2021.9], ValueError),
+    (lambda np: np.array([2020.0, 2021.5]), ValueError),
+    (lambda np: iter([2021.9]), ValueError),
+    (lambda np: [float('nan')], ValueError),
+    (lambda np: ['2021'], TypeError),
+    (lambda np: np.array([], dtype=str), TypeError),
+])
+def test_easter_array_non_integral_years(make_years, exc):
+    # easter() rejects these too, rather than truncating them
+    np = pytest.importorskip("numpy")
+    with pytest.raises(exc):
+        easter_array(make_years(np))
+
+
+@pytest.mark.parametrize("year", [0, 10000])
+@pytest.mark.parametrize("method", [EASTER_WESTERN, EASTER_ORTHODOX,
+                                    EASTER_JULIAN])
+def test_easter_bad_year(year, method):
+    with pytest.raises(ValueError):
+        easter(year, method)
+
+
+@pytest.mark.parametrize("year", [5243, 5395, 5463])
+def test_easter_array_no_valid_date(year):
+    # easter() cannot build a date for these years either
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError) as easter_exc:
+        easter(year, EASTER_ORTHODOX)
+    with pytest.raises(ValueError) as array_exc:
+        easter_array([2000, year], EASTER_ORTHODOX)
+    assert str(array_exc.value) == str(easter_exc.value)
+
+
+@pytest.mark.parametrize("years", [[0], [-5], [10000], [2000, 10000]])
+def test_easter_array_bad_year(years):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        easter_array(years)
@@ -11,7 +11,7 @@ import sys
 import pytest
 import warnings
 
-from dateutil.parser._parser import _ymd
+from dateutil.parser._parser import _ymd, _days_in_month
 from dateutil import tz
 
 IS_PY32 = sys.version_info[0:2] == (3, 2)
@@ -44,6 +44,40 @@ def test_YMD_could_be_day():
     assert ymd.could_be_day(31)
 
 
+@pytest.mark.smoke
+def test_YMD_typed_append():
+    ymd = _ymd()
+    ymd.append_int(3, 'M')
+    ymd.append_numtok('05')
+    assert not ymd.century_specified
+
+    ymd.append_numtok('099')
+    assert ymd.century_specified
+    assert ymd.has_year
+    assert ymd == [3, 5, 99]
+
+
+def test_result_len_counts_set_slots():
+    from dateutil.parser._parser import parser
+
+    res = parser._result()
+    assert len(res) == 0
+
+    res.year = 2003
+    res.tzoffset = 0
+    assert len(res) == 2
+
+
+@pytest.mark.parametrize('year', [1900, 2000, 2003, 2004])
+def test_days_in_month(year):
+    from calendar import monthrange
+    for month in range(1, 13):
+        assert _days_in_month(year, month) == monthrange(year, month)[1]
+
+    with pytest.raises(ValueError):
+        _days_in_month(year, 13)
+
+
 ###
 # Test that private interfaces in _parser are deprecated properly
 @pytest.mark.skipif(IS_PY32, reason='pytest.warns not supported on Python 3.2')
@@ -8,7 +8,7 @@ import sys
 
 from dateutil import tz
 from dateutil.tz import tzoffset
-from dateutil.parser import parse, parserinfo
+from dateutil.parser import parse, parse_cached, parser, parserinfo
 from dateutil.parser import ParserError
 from dateutil.parser import UnknownTimezoneWarning
 
@@ -18,6 +18,7 @@ from six import assertRaisesRegex, PY2
 from io import StringIO
 
 import pytest
+from freezegun import freeze_time
 
 # Platform info
 IS_WIN = sys.platform.startswith('win')
@@ -962,3 +963,211 @@ def test_parsererror_repr():
     s = repr(ParserError("Problem with string: %s", "2019-01-01"))
 
     assert s == "ParserError('Problem with string: %s', '2019-01-01')"
+
+
+@pytest.mark.parametrize('timestr', [
+    'Thu Sep 25 10:36:28 BRST 2003',
+    '2003-09-25T10:49:41.5-03:00',
+    '10:36:28,5 Sep.25.2003',
+    '1.a', '1.a ', '1.ab', '12,', '1,5', 'a.b1.2c', '4:30:21.447.',
+    '  \t', '\x00 1\x00 2',
+])
+def test_timelex_split_matches_stream(timestr):
+    # Strings are split with a regular expression, which must tokenize
+    # exactly like the character-at-a-time reader used for streams
+    from dateutil.parser._parser import _timelex
+
+    expected = list(_timelex(StringIO(timestr)))
+    assert _timelex.split(timestr) == expected
+    assert _timelex.split(StringIO(timestr)) == expected
+
+
+def test_parserinfo_tables_shared():
+    assert parserinfo()._jump is parserinfo()._jump
+
+    class CustomInfo(parserinfo):
+        MONTHS = list(parserinfo.MONTHS)
+
+    CustomInfo.MONTHS[0] = ("Jan", "January", "Janvier")
+    assert CustomInfo().month("Janvier") == 1
+    assert parserinfo().month("Janvier") is None
+
+
+def test_parserinfo_tables_bounded():
+    from dateutil.parser._parser import (_PARSERINFO_TABLES,
+                                         _PARSERINFO_TABLES_SIZE)
+
+    for i in range(_PARSERINFO_TABLES_SIZE):
+        jump = list(parserinfo.JUMP) + ["jump%d" % i]
+        type(str("DynamicInfo%d" % i), (parserinfo,), {"JUMP": jump})()
+
+    assert len(_PARSERINFO_TABLES) <= _PARSERINFO_TABLES_SIZE
+    assert parserinfo()._jump is parserinfo()._jump
+
+
+def test_parserinfo_tables_not_shared_for_writes():
+    class MyInfo(parserinfo):
+        def __init__(self, *args, **kwargs):
+            super(MyInfo, self).__init__(*args, **kwargs)
+            self._hms['hrs'] = 0
+
+    assert MyInfo().hms('hrs') == 0
+    assert parserinfo().hms('hrs') is None
+    assert parserinfo()._months is not parserinfo()._months
+
+    with pytest.raises(ParserError):
+        parse('10 hrs')
+
+
+def test_parserinfo_custom_month_table():
+    class FrenchInfo(parserinfo):
+        def __init__(self, *args, **kwargs):
+            super(FrenchInfo, self).__init__(*args, **kwargs)
+            self._months = self._convert([
+                ("janv", "janvier"), ("févr", "février"), ("mars",),
+                ("avr", "avril"), ("mai",), ("juin",), ("juil", "juillet"),
+                ("août",), ("sept", "septembre"), ("oct", "octobre"),
+                ("nov", "novembre"), ("déc", "décembre")])
+
+    info = FrenchInfo()
+    assert info.month("janvier") == 1
+    assert info.classify("décembre") == ('month', 12)
+    assert parse("3 janvier 2020", parserinfo=info) == datetime(2020, 1, 3)
+
+
+def test_parserinfo_subclass_without_super_init():
+    class CopiedInfo(parserinfo):
+        def __init__(self):
+            # Deliberately skip parserinfo.__init__
+            self.__dict__.update(vars(parserinfo()))
+            del self._classified
+
+    info = CopiedInfo()
+    assert info.classify("Sept") == ('month', 9)
+    assert parse("Sept 3 2020", parserinfo=info) == datetime(2020, 9, 3)
+
+
+def test_parserinfo_membership_tables():
+    info = parserinfo()
+    assert info._jump == frozenset(info._convert(parserinfo.JUMP))
+    assert info.jump("AT") and not info.jump("Jan")
+    assert info.utczone("gmt") and info.pertain("Of")
+
+
+@pytest.mark.parametrize('name,expected', [
+    ('Mon', ('weekday', 0)),
+    ('SEPT', ('month', 9)),
+    ('a', ('ampm', 0)),
+    ('m', ('jump', True)),
+    ('hours', ('hms', 0)),
+    ('utc', ('utczone', True)),
+    ('foo', (None, None)),
+])
+def test_parserinfo_classify(name, expected):
+    assert parserinfo().classify(name) == expected
+
+
+def test_parserinfo_classify_uses_overrides():
+    class CustomInfo(parserinfo):
+        def month(self, name):
+            if name == "Brumaire":
+                return 11
+            return super(CustomInfo, self).month(name)
+
+    info = CustomInfo()
+    assert info.classify("Brumaire") == ('month', 11)
+    assert parse("5 Brumaire 2003", parserinfo=info) == datetime(2003, 11, 5)
+
+
+def test_parserinfo_classify_overrides_checked_per_class():
+    class PlainInfo(parserinfo):
+        pass
+
+    class CustomInfo(PlainInfo):
+        def month(self, name):
+            return 11 if name == "Brumaire" else None
+
+    assert PlainInfo().classify("Brumaire") == (None, None)
+    assert CustomInfo().classify("Brumaire") == ('month', 11)
+
+
+def test_parserinfo_classify_subclass_collectable():
+    import gc
+    import weakref
+
+    class ThrowawayInfo(parserinfo):
+        pass
+
+    assert ThrowawayInfo().classify("Sept") == ('month', 9)
+
+    ref = weakref.ref(ThrowawayInfo)
+    del ThrowawayInfo
+    gc.collect()
+    assert ref() is None
+
+
+def test_parserinfo_year_follows_clock():
+    # The current year is cached, but must be refreshed once it changes
+    with freeze_time(datetime(2010, 6, 1)):
+        assert parserinfo().convertyear(61) == 1961
+
+    with freeze_time(datetime(2090, 6, 1)):
+        assert parserinfo().convertyear(61) == 2061
+        assert parserinfo().convertyear(39) == 2139
+
+
+@pytest.mark.parametrize('timestr,kwargs', [
+    ("Thu Sep 25 10:36:28 2003", {}),
+    ("10:36:28", {}),
+    ("01/05/09", {'dayfirst': True}),
+    ("Today is 25 of September of 2003, exactly at 10:49:41",
+     {'fuzzy_with_tokens': True}),
+])
+def test_parse_cached(timestr, kwargs):
+    default = datetime(2003, 9, 25)
+    expected = parse(timestr, default=default, **kwargs)
+
+    assert parse_cached(timestr, default=default, **kwargs) == expected
+    assert parse_cached(timestr, default=default, **kwargs) == expected
+
+
+def test_parse_cached_applies_default_and_tzinfos():
+    # Only the interpretation of the string is cached, not the result
+    tzinfos = {"BRST": -10800}
+    dt1 = parse_cached("10:36:28 BRST", default=datetime(2003, 9, 25),
+                       tzinfos=tzinfos)
+    dt2 = parse_cached("10:36:28 BRST", default=datetime(2004, 1, 1),
+                       ignoretz=True)
+
+    assert dt1 == datetime(2003, 9, 25, 10, 36, 28,
+                           tzinfo=tzoffset("BRST", -10800))
+    assert dt2 == datetime(2004, 1, 1, 10, 36, 28)
+
+
+def test_parse_cached_error():
+    for _ in range(2):
+        with pytest.raises(ParserError):
+            parse_cached("not a date")
+
+
+@pytest.mark.parametrize('timestr', [
+    "2003-09-25", "2003-09-05", "0099-01-02",
+    "2003-09-25T10:49", "2003-09-25 10:49:41",
+    "2003-09-25T10:49:41.5", "2003-09-25T10:49:41.123456789",
+    "2003-09-25T10:49:41Z", "2003-09-25T10:49:41+00:00",
+    "2003-09-25T10:49:41-03:00", "2003-09-25T10:49:41-0300",
+    "2003-09-25T10:49+03",
+])
+@pytest.mark.parametrize('dayfirst', [False, True])
+def test_parse_iso_fast_path(timestr, dayfirst):
+    # parser subclasses don't take the fast path for ISO 8601 strings, so
+    # this compares it against the general token loop
+    class SlowParser(parser):
+        pass
+
+    default = datetime(2001, 2, 3, 4, 5, 6, 7)
+    expected = SlowParser().parse(timestr, default=default, dayfirst=dayfirst)
+    dt = parse(timestr, default=default, dayfirst=dayfirst)
+
+    assert dt == expected
+    assert dt.tzinfo == expected.tzinfo
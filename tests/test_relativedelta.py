@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 from ._common import NotAValue
 
 import calendar
+import pickle
 from datetime import datetime, date, timedelta
 import unittest
 
@@ -288,6 +289,34 @@ class RelativeDeltaTest(unittest.TestCase):
         self.assertFalse(relativedelta(days=0))
         self.assertTrue(relativedelta(days=1))
 
+    def testBooleanDiff(self):
+        self.assertFalse(relativedelta(self.now, self.now))
+        self.assertTrue(relativedelta(self.now, self.today))
+
+    def testBooleanWeeksSetter(self):
+        rd = relativedelta()
+        rd.weeks = 1
+        self.assertTrue(rd)
+        rd.weeks = 0
+        self.assertFalse(rd)
+
+    def testBooleanPickle(self):
+        self.assertTrue(pickle.loads(pickle.dumps(relativedelta(month=1))))
+        self.assertFalse(pickle.loads(pickle.dumps(relativedelta())))
+
+    def testBooleanFieldAssignment(self):
+        rd = relativedelta()
+        rd.days = 5
+        self.assertTrue(rd)
+
+        rd = relativedelta(days=3)
+        rd.days = 0
+        self.assertFalse(rd)
+
+        rd = relativedelta()
+        rd.weekday = MO
+        self.assertTrue(rd)
+
     def testAbsoluteValueNegative(self):
         rd_base = relativedelta(years=-1, months=-5, days=-2, hours=-3,
                                 minutes=-5, seconds=-2, microseconds=-12)
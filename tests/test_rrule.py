@@ -2592,6 +2592,48 @@ class RRuleTest(unittest.TestCase):
                           datetime(1997, 9, 5, 9, 0),
                           datetime(1997, 9, 6, 9, 0)])
 
+    def testBetweenFarFromDtstart(self):
+        after = datetime(1997, 9, 2, 9, 0)
+        before = datetime(1998, 9, 2, 9, 0)
+        for freq in (YEARLY, MONTHLY, WEEKLY, DAILY):
+            rr = rrule(freq, interval=2, byweekday=(TU, TH),
+                       dtstart=datetime(1900, 9, 2, 9, 0),
+                       until=datetime(2000, 1, 1))
+            expected = [x for x in rr if after < x < before]
+
+            self.assertEqual(rr.between(after, before), expected)
+            self.assertEqual(rr.after(after), expected[0])
+            self.assertEqual(rr.count(), len(list(rr)))
+
+    def testAfterFillsCache(self):
+        rr = rrule(DAILY, cache=True,
+                   dtstart=datetime(1997, 9, 2, 9, 0),
+                   until=datetime(1997, 12, 31))
+        self.assertEqual(rr.after(datetime(1997, 9, 10)),
+                         datetime(1997, 9, 10, 9, 0))
+        self.assertTrue(rr._cache)
+        self.assertEqual(rr._cache[0], datetime(1997, 9, 2, 9, 0))
+
+    def testAfterDateRaisesTypeError(self):
+        rr = rrule(DAILY, dtstart=datetime(1997, 9, 2, 9, 0),
+                   until=datetime(1997, 12, 31))
+        with self.assertRaises(TypeError):
+            rr.after(date(1997, 9, 10))
+        with self.assertRaises(TypeError):
+            rr.between(date(1997, 9, 10), date(1997, 9, 20))
+
+    def testAfterDtstartNearMinDate(self):
+        # wkst falls before date.min in the first week
+        for wkst in (MO, TU, WE, TH, FR, SA, SU):
+            rr = rrule(WEEKLY, dtstart=datetime(1, 1, 1), wkst=wkst)
+            self.assertEqual(rr.after(datetime(2000, 1, 1)),
+                             datetime(2000, 1, 3))
+            self.assertEqual(rr.after(datetime(1, 1, 1)),
+                             datetime(1, 1, 8))
+            self.assertEqual(rr.between(datetime(1, 1, 1),
+                                        datetime(1, 1, 20)),
+                             [datetime(1, 1, 8), datetime(1, 1, 15)])
+
     def testCachePre(self):
         rr = rrule(DAILY, count=15, cache=True,
                    dtstart=datetime(1997, 9, 2, 9, 0))
@@ -2665,6 +2707,29 @@ class RRuleTest(unittest.TestCase):
         for x in rr: pass
         self.assertEqual(datetime(1997, 9, 3, 9, 0) in rr, True)
 
+    def testCachePostBeforeAfterBetween(self):
+        rr = rrule(DAILY, count=5, cache=True,
+                   dtstart=datetime(1997, 9, 2, 9, 0))
+        for x in rr: pass
+        self.assertEqual(rr.before(datetime(1997, 9, 4, 9, 0)),
+                         datetime(1997, 9, 3, 9, 0))
+        self.assertEqual(rr.before(datetime(1997, 9, 4, 9, 0), inc=True),
+                         datetime(1997, 9, 4, 9, 0))
+        self.assertEqual(rr.before(datetime(1997, 9, 2, 9, 0)), None)
+        self.assertEqual(rr.after(datetime(1997, 9, 4, 9, 0)),
+                         datetime(1997, 9, 5, 9, 0))
+        self.assertEqual(rr.after(datetime(1997, 9, 4, 9, 0), inc=True),
+                         datetime(1997, 9, 4, 9, 0))
+        self.assertEqual(rr.after(datetime(1997, 9, 6, 9, 0)), None)
+        self.assertEqual(rr.between(datetime(1997, 9, 3, 9, 0),
+                                    datetime(1997, 9, 5, 9, 0)),
+                         [datetime(1997, 9, 4, 9, 0)])
+        self.assertEqual(rr.between(datetime(1997, 9, 3, 9, 0),
+                                    datetime(1997, 9, 5, 9, 0), inc=True),
+                         [datetime(1997, 9, 3, 9, 0),
+                          datetime(1997, 9, 4, 9, 0),
+                          datetime(1997, 9, 5, 9, 0)])
+
     def testStr(self):
         self.assertEqual(list(rrulestr(
                               "DTSTART:19970902T090000\n"
@@ -2874,6 +2939,25 @@ class RRuleTest(unittest.TestCase):
                             datetime(1997, 9, 9, 9, 0, tzinfo=BXL),
                             datetime(1997, 9, 16, 9, 0, tzinfo=BXL)]
 
+    def testStrSetExDateWithTZIDLookedUpOnce(self):
+        lookups = []
+        def tzids(name):
+            lookups.append(name)
+            return tz.tzstr('UTC+04')
+
+        TZ = tz.tzstr('UTC+04')
+        rr = rrulestr("DTSTART;TZID=UTC+04:19970902T090000\n"
+                      "RRULE:FREQ=YEARLY;COUNT=6;BYDAY=TU,TH\n"
+                      "EXDATE;TZID=UTC+04:19970904T090000\n"
+                      "EXDATE;TZID=UTC+04:19970911T090000\n"
+                      "EXDATE;TZID=UTC+04:19970918T090000\n",
+                      tzids=tzids)
+
+        assert lookups == ['UTC+04']
+        assert list(rr) == [datetime(1997, 9, 2, 9, 0, tzinfo=TZ),
+                            datetime(1997, 9, 9, 9, 0, tzinfo=TZ),
+                            datetime(1997, 9, 16, 9, 0, tzinfo=TZ)]
+
     def testStrSetExDateValueDateTimeNoTZID(self):
         rrstr = '\n'.join([
             "DTSTART:19970902T090000",